@@ -1,6 +1,5 @@
 import re
 
-from sectiondoc.items.regex import definition_regex, header_regex
 from sectiondoc.items.item import Item
 from sectiondoc.util import trim_indent
 
@@ -115,8 +114,7 @@ class AnyItem(Item):
 
         """
         header = lines[0].strip()
-        term, classifier = header_regex.split(header, maxsplit=1) if \
-            (' :' in header) else (header, '')
+        term, _, classifier = header.partition(' :')
         classifier = classifier.strip()
         classifier = [] if classifier == '' else [classifier]
         trimed_lines = trim_indent(lines[1:]) if (len(lines) > 1) else []
@@ -2,21 +2,20 @@ import re
 
 function_regex = re.compile(r'\w+\(.*\)\s*')
 signature_regex = re.compile('\((.*)\)')
-header_regex = re.compile(r'\s:\s?')
 definition_regex = re.compile(r"""
-\*{0,2}            #  no, one or two stars
-\w+\s:             #  a word followed by a space and a semicolumn
-(
-        \s         # just a space
-    |              # OR
-        \s[\w.]+   # dot separated words
-        (\(.*\))?  # with maybe a signature
-    |
-        \s[\w.]+   # dot separated words
-        (\(.*\))?
-        \sor       # with an or in between
-        \s[\w.]+
-        (\(.*\))?
+\*{0,2}                #  no, one or two stars
+\w+\s:                 #  a word followed by a space and a semicolumn
+(?:
+    \s                 #  a space
+    (?:
+        [\w.]+         #  maybe followed by dot separated words
+        (?:\(.*\))?    #  with maybe a signature
+        (?:
+            \sor\s     #  and maybe an or in between
+            [\w.]+
+            (?:\(.*\))?
+        )?
+    )?
 )?
-$                  # match at the end of the line
+\Z                     #  match at the end of the line
 """, re.VERBOSE)
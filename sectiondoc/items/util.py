@@ -11,9 +11,9 @@ def max_attribute_length(items, attr):
 
     """
     if attr == 'definition':
-        maximum = max([len(' '.join(item.definition)) for item in items])
+        maximum = max(len(' '.join(item.definition)) for item in items)
     else:
-        maximum = max([len(getattr(item, attr)) for item in items])
+        maximum = max(len(getattr(item, attr)) for item in items)
     return maximum
 
 
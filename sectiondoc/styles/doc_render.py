@@ -14,6 +14,7 @@ from sectiondoc.sections import rubric
 
 
 underline_regex = re.compile(r'\s*\S+\s*\Z')
+header_characters_regex = re.compile(r'[A-Za-z\\]|\b\s')
 
 
 class DocRender(object):
@@ -62,10 +63,10 @@ class DocRender(object):
             every section using the rubric rendering function.
 
         """
-        try:
-            self._docstring = lines.splitlines()
-        except AttributeError:
+        if isinstance(lines, list):
             self._docstring = lines
+        else:
+            self._docstring = lines.splitlines()
         self.sections = {} if sections is None else sections
         self.bookmarks = []
         self.index = 0
@@ -74,32 +75,46 @@ class DocRender(object):
         """ Parse the docstring for sections.
 
         The docstring is parsed for sections. If a section is found then
-        the corresponding section rendering method is called.
+        the corresponding section rendering method is called. The rendered
+        docstring is collected separately and copied back into the
+        docstring list once parsing is complete.
 
         """
-        self.index = 0
+        docstring = self._docstring
+        output = []
+        start = self.index = 0
         self.seek_to_next_non_empty_line()
-        while not self.eod:
+        while self.index < len(docstring):
             section = self.is_section()
             if len(section) > 0:
-                self._render(section)
+                output.extend(docstring[start:self.index])
+                output.extend(self._render(section))
+                start = self.index
             else:
                 self.index += 1
                 self.seek_to_next_non_empty_line()
+        output.extend(docstring[start:])
+        docstring[:] = output
+        self.index = len(docstring)
 
     def _render(self, section):
         """ Call the section rendering function.
 
-        The header is removed from the docstring and the appropriate
-        rendering function is executed.
+        The header (and the empty line after it) is skipped and the
+        appropriate rendering function is executed. The lines that the
+        rendering function moved over without consuming are returned
+        before the rendered section lines.
 
         """
-        self.remove_lines(self.index, 2)  # Remove header
-        self.remove_if_empty(self.index)  # Remove space after header
+        docstring = self._docstring
+        self.index += 2  # Skip header
+        if self.index < len(docstring) and is_empty(docstring[self.index]):
+            self.index += 1  # Skip space after header
+        start = self.index
         method, renderer, item_class = self.sections.get(
             section, (rubric, None, None))
         lines = method(self, section, renderer, item_class)
-        self.insert_and_move(lines, self.index)
+        return docstring[start:self.index] + lines
 
     def extract_items(self, item_type=None):
         """ Extract the section items from a docstring.
@@ -108,13 +123,16 @@ class DocRender(object):
         provided item type. The method starts at the current line index
         position and checks if in the next two lines contain a valid item of
         the desired type. If successful, the lines that belong to the item
-        description block (i.e. item header + item body) are popped out from
-        the docstring and passed to the ``item_type.parser`` class method to
-        get a new instance of ``item_type``.
+        description block (i.e. item header + item body) are collected and
+        the index moves past them. The docstring itself is left untouched
+        while scanning.
 
         The process is repeated until there are no compatible ``item_type``
-        items found in the section or we run out of docstring lines,
-        The collected item instances are returned
+        items found in the section or we run out of docstring lines. The
+        scanned range is then replaced in the docstring with a single slice
+        assignment that keeps only the empty lines skipped between items.
+        Each collected block is passed to the ``item_type.parse`` class
+        method, and the resulting item instances are returned.
 
         The exit conditions allow for two valid section item layouts:
 
@@ -154,12 +172,22 @@ class DocRender(object):
         """
         item_type = AnyItem if item_type is None else item_type
         is_item = item_type.is_item
+        docstring = self._docstring
+        start = self.index
         item_blocks = []
+        remaining = []
         while (
                 not self.is_section() and
                 (is_item(self.peek()) or is_item(self.peek(1)))):
-            self.remove_if_empty(self.index)
-            item_blocks.append(self.get_next_block())
+            if is_empty(docstring[self.index]):
+                self.index += 1
+            block, end, next_index = self._scan_block(self.index)
+            item_blocks.append(block)
+            remaining += docstring[end:next_index]
+            self.index = next_index
+        # remove all the item blocks from the docstring at once
+        docstring[start:self.index] = remaining
+        self.index = start + len(remaining)
         return [item_type.parse(block) for block in item_blocks]
 
     def get_next_block(self):
@@ -176,24 +204,57 @@ class DocRender(object):
         as the field header or two empty lines in sequence.
 
         """
-        item_header = self.pop()
+        block, end, next_index = self._scan_block(self.index)
+        del self._docstring[self.index:end]
+        self.index += next_index - end
+        return block
+
+    def _scan_block(self, index):
+        """ Find the limits of the item block that starts at ``index``.
+
+        The docstring is not modified.
+
+        Returns
+        -------
+        block : list
+            The item header and the definition lines of the block.
+
+        end : int
+            The index after the last line that belongs to the block.
+
+        next_index : int
+            The index of the line to continue from. The lines between
+            ``end`` and ``next_index`` are empty lines that do not belong
+            to the block.
+
+        """
+        docstring = self._docstring
+        length = len(docstring)
+        item_header = docstring[index]
         sub_indent = get_indent(item_header) + ' '
+        width = len(sub_indent)
         block = [item_header]
-        while not self.eod:
-            current = self.peek()
-            next = self.peek(1)
-            if is_empty(current) and is_empty(next):
-                self.seek_to_next_non_empty_line()
-                break
-            elif is_empty(current) and not next.startswith(sub_indent):
-                self.pop()
+        end = index + 1
+        while end < length:
+            current = docstring[end]
+            if not current.strip():
+                # an empty line is only part of the block when the
+                # definition continues on the next line
+                following = docstring[end + 1] if end + 1 < length else ''
+                if not following.strip():
+                    next_index = end + 1
+                    while (
+                            next_index < length and
+                            not docstring[next_index].strip()):
+                        next_index += 1
+                    return block, end, next_index
+                elif following[:width] != sub_indent:
+                    return block, end + 1, end + 1
+            elif current[:width] != sub_indent:
                 break
-            elif not is_empty(current) and not current.startswith(sub_indent):
-                break
-            else:
-                line = self.pop()
-                block += [line.rstrip()]
-        return block
+            block.append(current.rstrip())
+            end += 1
+        return block, end, end
 
     def is_section(self):
         """ Check if the current line defines a section.
@@ -201,11 +262,14 @@ class DocRender(object):
         .. todo:: split and cleanup this method.
 
         """
-        if self.eod:
+        docstring = self._docstring
+        index = self.index
+        length = len(docstring)
+        if index >= length:
             return False
 
-        header = self.peek()
-        line2 = self.peek(1)
+        header = docstring[index]
+        line2 = docstring[index + 1] if index + 1 < length else ''
 
         # check for underline type format
         underline = underline_regex.match(line2)
@@ -213,14 +277,17 @@ class DocRender(object):
             return ''
         # is the next line an rst section underline?
         striped_header = header.rstrip()
-        expected_underline1 = re.sub(r'[A-Za-z\\]|\b\s', '-', striped_header)
-        expected_underline2 = re.sub(r'[A-Za-z\\]|\b\s', '=', striped_header)
-        if (
-                (underline.group().rstrip() == expected_underline1) or
-                (underline.group().rstrip() == expected_underline2)):
-            return header.strip()
-        else:
+        striped_underline = underline.group().rstrip()
+        # the expected underline has one character per header character
+        if len(striped_underline) != len(striped_header):
             return ''
+        expected_underline = header_characters_regex.sub('-', striped_header)
+        if striped_underline == expected_underline:
+            return header.strip()
+        expected_underline = header_characters_regex.sub('=', striped_header)
+        if striped_underline == expected_underline:
+            return header.strip()
+        return ''
 
     def insert_lines(self, lines, index):
         """ Insert lines in the docstring.
@@ -234,11 +301,10 @@ class DocRender(object):
             Index to start the insertion
 
         """
-        docstring = self.docstring
+        docstring = self._docstring
         if len(docstring) < index:
             raise IndexError('index out of bounds')
-        for line in reversed(lines):
-            docstring.insert(index, line)
+        docstring[index:index] = lines
 
     def insert_and_move(self, lines, index):
         """ Insert lines and move the current index to the end.
@@ -251,20 +317,24 @@ class DocRender(object):
         """ Goto the next non_empty line.
 
         """
-        docstring = self.docstring
-        for line in docstring[self.index:]:
-            if not is_empty(line):
-                break
-            self.index += 1
+        docstring = self._docstring
+        length = len(docstring)
+        index = self.index
+        while index < length and is_empty(docstring[index]):
+            index += 1
+        self.index = index
 
     def get_next_paragraph(self):
         """ Get the next paragraph designated by an empty line.
 
         """
-        lines = []
-        while (not self.eod) and (not is_empty(self.peek())):
-            line = self.pop()
-            lines.append(line)
+        docstring = self._docstring
+        length = len(docstring)
+        index = end = self.index
+        while end < length and not is_empty(docstring[end]):
+            end += 1
+        lines = docstring[index:end]
+        del docstring[index:end]
         return lines
 
     def read(self):
@@ -280,15 +350,14 @@ class DocRender(object):
         """ Removes the lines from the docstring
 
         """
-        docstring = self.docstring
-        del docstring[index:(index + count)]
+        del self._docstring[index:(index + count)]
 
     def remove_if_empty(self, index=None):
         """ Remove the line from the docstring if it is empty.
 
         """
         index = self.index if index is None else index
-        if is_empty(self.docstring[index]):
+        if is_empty(self._docstring[index]):
             self.remove_lines(index)
 
     def bookmark(self):
@@ -327,7 +396,7 @@ class DocRender(object):
         """
         position = self.index + ahead
         try:
-            line = self.docstring[position]
+            line = self._docstring[position]
         except IndexError:
             line = ''
         return line
@@ -344,7 +413,7 @@ class DocRender(object):
         """ End of docstring.
 
         """
-        return self.index >= len(self.docstring)
+        return self.index >= len(self._docstring)
 
     @property
     def docstring(self):
@@ -1,10 +1,45 @@
 class Style(object):
+    """ A docstring rendering style for the sphinx autodoc extension.
 
-    def __init__(self, rendering_map):
+    The style maps the autodoc object types to the docstring renderer
+    factories and renders the docstring lines inplace. Rendered
+    docstrings are cached, since the same (e.g. inherited) docstring is
+    commonly processed many times during a sphinx build.
+
+    """
+
+    def __init__(self, rendering_map, cache_size=4096):
+        """
+
+        Arguments
+        ---------
+        rendering_map : dict
+            Maps the autodoc object type (e.g. ``'class'``) to a callable
+            that accepts the docstring lines and returns a renderer
+            instance with a ``parse`` method.
+
+        cache_size : int
+            The maximum number of rendered docstrings to keep. When the
+            cache is full it is emptied completely before the next entry
+            is added; older entries are not evicted individually.
+
+        """
         self.rendering_map = rendering_map
+        self.cache_size = cache_size
+        self._cache = {}
 
     def render_docstring(self, app, what, name, obj, options, lines):
         renderer_factory = self.rendering_map.get(what, None)
         if renderer_factory is not None:
-            docstring_renderer = renderer_factory(lines)
-            docstring_renderer.parse()
+            # Inherited docstrings reach us many times during a build, the
+            # rendered lines only depend on the renderer and the input lines.
+            key = (renderer_factory, tuple(lines))
+            rendered = self._cache.get(key)
+            if rendered is None:
+                docstring_renderer = renderer_factory(lines)
+                docstring_renderer.parse()
+                if len(self._cache) >= self.cache_size:
+                    self._cache.clear()
+                self._cache[key] = tuple(lines)
+            else:
+                lines[:] = rendered
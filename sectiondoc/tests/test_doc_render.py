@@ -247,6 +247,12 @@ class TestDocRender(unittest.TestCase):
         doc_render.index = 8
         self.assertFalse(doc_render.is_section())
 
+        # given
+        doc_render = DocRender(['a\0b', '-\0-'])
+
+        # when/then
+        self.assertEqual(doc_render.is_section(), 'a\0b')
+
     def test_get_next_block(self):
         doc_render = DocRender([
             'term1',
@@ -360,6 +366,24 @@ This is just some sample text.
         output = '\n'.join(docstring_lines) + '\n'
         self.assertMultiLineEqual(rst, output)
 
+    def test_render_header_at_the_end(self):
+        # given
+        docstring_lines = [
+            ' This is a sample docstring.',
+            '',
+            'My Header',
+            '---------']
+        doc_render = DocRender(docstring_lines)
+
+        # when
+        doc_render.parse()
+
+        # then
+        self.assertEqual(
+            docstring_lines,
+            [' This is a sample docstring.', '', '.. rubric:: My Header', ''])
+        self.assertTrue(doc_render.eod)
+
 
 if __name__ == '__main__':
     unittest.main()
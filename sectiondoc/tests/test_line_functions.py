@@ -70,5 +70,11 @@ class TestLineFunctions(unittest.TestCase):
         output = replace_at('   3', input, 30)
         self.assertEqual(expected, output)
 
+        output = replace_at('abab', 'xx', -2)
+        self.assertEqual('ab', output)
+
+        output = replace_at('xxxxxxx', 'abababab', -3)
+        self.assertEqual('ababaxxx', output)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,88 @@
+from sectiondoc.styles import Style
+from sectiondoc.styles.legacy import function_section
+from sectiondoc.tests._compat import unittest
+
+
+class TestStyle(unittest.TestCase):
+
+    def setUp(self):
+        self.maxDiff = None
+        self.calls = []
+
+        def renderer_factory(lines):
+            self.calls.append(list(lines))
+            return function_section(lines)
+
+        self.style = Style({'function': renderer_factory})
+
+    def test_render_docstring(self):
+        # given
+        docstring = [
+            'Render the docstring.',
+            '',
+            'Notes',
+            '-----',
+            'The lines are changed inplace.']
+        rst = [
+            'Render the docstring.',
+            '',
+            '.. note::',
+            '    The lines are changed inplace.']
+        lines = list(docstring)
+
+        # when
+        self.style.render_docstring(None, 'function', '', None, {}, lines)
+
+        # then
+        self.assertEqual(lines, rst)
+        self.assertEqual(self.calls, [docstring])
+
+    def test_render_docstring_cached(self):
+        # given
+        docstring = [
+            'Render the docstring.',
+            '',
+            'Notes',
+            '-----',
+            'The lines are changed inplace.']
+        first = list(docstring)
+        second = list(docstring)
+        self.style.render_docstring(None, 'function', '', None, {}, first)
+
+        # when
+        self.style.render_docstring(None, 'function', '', None, {}, second)
+
+        # then
+        self.assertEqual(second, first)
+        self.assertEqual(len(self.calls), 1)
+
+    def test_render_docstring_cache_size(self):
+        # given
+        self.style.cache_size = 1
+        first = ['First docstring.']
+        second = ['Second docstring.']
+
+        # when
+        self.style.render_docstring(None, 'function', '', None, {}, first)
+        self.style.render_docstring(None, 'function', '', None, {}, second)
+        self.style.render_docstring(None, 'function', '', None, {}, first)
+
+        # then
+        self.assertEqual(len(self.calls), 3)
+
+    def test_render_docstring_unknown_type(self):
+        # given
+        lines = ['Module docstring.', '', 'Notes', '-----', 'Some notes.']
+
+        # when
+        self.style.render_docstring(None, 'module', '', None, {}, lines)
+
+        # then
+        self.assertEqual(
+            lines,
+            ['Module docstring.', '', 'Notes', '-----', 'Some notes.'])
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,13 +6,6 @@
 #  Copyright (c) 2011, Enthought, Inc.
 #  All rights reserved.
 #-----------------------------------------------------------------------------
-import re
-
-
-#-----------------------------------------------------------------------------
-#  Pre-compiled regexes
-#-----------------------------------------------------------------------------
-indent_regex = re.compile(r'\s+')
 
 
 #-----------------------------------------------------------------------------
@@ -46,14 +39,8 @@ def add_indent(lines, indent=4):
     Empty strings are not changed.
 
     """
-    indent_str = ' ' * indent if indent != 0 else ''
-    output = []
-    for line in lines:
-        if is_empty(line):
-            output.append(line)
-        else:
-            output.append(indent_str + line)
-    return output
+    indent_str = ' ' * indent
+    return [indent_str + line if line.strip() else line for line in lines]
 
 
 def remove_indent(lines):
@@ -83,11 +70,7 @@ def get_indent(line):
     """ Return the indent portion of the line.
 
     """
-    indent = indent_regex.match(line)
-    if indent is None:
-        return ''
-    else:
-        return indent.group()
+    return line[:len(line) - len(line.lstrip())]
 
 
 #------------------------------------------------------------------------------
@@ -103,11 +86,11 @@ def is_empty(line):
 #------------------------------------------------------------------------------
 
 def fix_star(word):
-    """ Replace ``*`` with ``\*`` so that is will be parsed properly by
+    """ Replace ``*`` with ``\\*`` so that is will be parsed properly by
     docutils.
 
     """
-    return word.replace('*', '\*')
+    return word.replace('*', r'\*')
 
 
 def fix_backspace(word):
@@ -124,7 +107,7 @@ def fix_trailing_underscore(word):
 
     """
     if word.endswith('_'):
-        word = word.replace('_', '\_')
+        word = word.replace('_', r'\_')
     return word
 
 